@@ -62,7 +62,7 @@ for i in range(100):  # Read up to 100 messages
                     decoder = Unpackr(mapsAsObjects=True)
                     decoded = decoder.unpack(msg)
                     print(f"       Frame content: t={decoded.get('t'):.2f}, drivers={len(decoded.get('drivers', {}))}")
-                except:
+                except (ImportError, ValueError, KeyError, TypeError):
                     pass
         else:
             # JSON text message
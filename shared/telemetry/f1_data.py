@@ -1,14 +1,15 @@
+import atexit
 import os
 import sys
+import zipfile
 import fastf1
 import fastf1.plotting
 from multiprocessing import Pool, cpu_count
-from collections import defaultdict
 import numpy as np
 import json
 import pickle
-from datetime import timedelta
 from pathlib import Path
+from scipy.interpolate import interp1d
 from scipy.signal import savgol_filter
 
 from shared.lib.tyres import get_tyre_compound_int
@@ -20,16 +21,28 @@ from shared.telemetry.fastf1_adapter import (
 
 import pandas as pd
 
-# Debug logging helper
+# numba is optional: when present the retirement tracker runs as a compiled
+# kernel, otherwise the pure-NumPy path below is used
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+# Debug logging helper: off by default (set F1_DEBUG=1 to enable). Writes go
+# through a large buffer instead of a flush/syscall per line.
+_DEBUG_ENABLED = os.environ.get("F1_DEBUG") == "1"
 _debug_log_file = None
 
 def _debug_log(message):
     global _debug_log_file
+    if not _DEBUG_ENABLED:
+        return
     if _debug_log_file is None:
         log_path = Path(__file__).parent.parent.parent / "debug_telemetry.log"
-        _debug_log_file = open(log_path, "w")
+        _debug_log_file = open(log_path, "w", buffering=1 << 20)
+        atexit.register(_debug_log_file.close)
     _debug_log_file.write(message + "\n")
-    _debug_log_file.flush()
 
 def enable_cache():
     # Check if cache folder exists
@@ -42,12 +55,111 @@ def enable_cache():
 FPS = 25
 DT = 1 / FPS
 
+if _HAS_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _detect_retirement_numba(speed_mat, dt, threshold):
+        """Latching zero-speed tracker: retired once speed == 0 for >= threshold seconds."""
+        num_drivers, num_frames = speed_mat.shape
+        retired = np.zeros((num_drivers, num_frames), dtype=np.bool_)
+        for d in prange(num_drivers):
+            zero_run = 0.0
+            latched = False
+            for f in range(num_frames):
+                if not latched:
+                    if speed_mat[d, f] == 0:
+                        zero_run += dt
+                        if zero_run >= threshold:
+                            latched = True
+                    else:
+                        zero_run = 0.0
+                retired[d, f] = latched
+        return retired
+
+
+def _detect_retirement_mat(speed_mat, dt, threshold):
+    """Compute the latched per-driver retirement matrix from a (D, F) speed matrix.
+
+    A driver is flagged retired once their speed has been exactly zero for at
+    least ``threshold`` seconds; the flag never clears. Uses the compiled numba
+    kernel when available, otherwise an equivalent vectorized NumPy pass: the
+    index of the last moving sample is propagated forward with
+    np.maximum.accumulate, so the length of the zero-speed run ending at each
+    frame falls out as a difference.
+    """
+    if _HAS_NUMBA:
+        return _detect_retirement_numba(np.ascontiguousarray(speed_mat), dt, threshold)
+    num_frames = speed_mat.shape[1]
+    zero_speed = speed_mat == 0
+    frame_indices = np.arange(num_frames)
+    last_moving = np.where(~zero_speed, frame_indices, -1)
+    np.maximum.accumulate(last_moving, axis=1, out=last_moving)
+    retired = (frame_indices - last_moving) * dt >= threshold
+    np.maximum.accumulate(retired, axis=1, out=retired)
+    return retired
+
+if _HAS_NUMBA:
+    @njit(cache=True)
+    def _is_monotonic(t):
+        """Single-pass monotonicity check; exits on the first violation."""
+        for i in range(1, len(t)):
+            if t[i] < t[i - 1]:
+                return False
+        return True
+else:
+    def _is_monotonic(t):
+        """Non-decreasing check (allocates one boolean temp without numba)."""
+        return bool(np.all(t[:-1] <= t[1:]))
+
+# Channels produced by _process_single_driver for each driver
+_DRIVER_CHANNELS = (
+    "t", "x", "y", "dist", "rel_dist", "lap", "tyre", "speed", "gear",
+    "drs", "throttle", "brake", "rpm", "lap_time", "sector1", "sector2", "sector3",
+)
+
+# Session object shared with pool workers via the Pool initializer: pickling it
+# once per worker instead of once per task keeps serialization traffic at
+# O(workers) rather than O(drivers)
+_worker_session = None
+
+def _init_worker(session):
+    global _worker_session
+    _worker_session = session
+
 def _process_single_driver(args):
     """Process telemetry data for a single driver - must be top-level for multiprocessing"""
-    driver_no, session, driver_code = args
+    driver_no, driver_code, refresh = args
+    session = _worker_session
 
     print(f"Getting telemetry for driver: {driver_code}")
 
+    # Per-driver cache shard: lets a re-run (or a run resumed after a partial
+    # failure) skip the expensive FastF1 lap/telemetry fetch for drivers that
+    # were already computed, instead of all-or-nothing on the top-level cache.
+    # Stored as .npz: numpy's binary format loads arrays directly without
+    # pickle's per-object protocol machinery.
+    event_name = str(session).replace(' ', '_')
+    shard_dir = Path(__file__).parent.parent.parent / "computed_data" / "per_driver"
+    shard_file = shard_dir / f"{event_name}_{driver_no}.npz"
+    if not refresh and "--refresh-data" not in sys.argv:
+        try:
+            with np.load(shard_file, allow_pickle=False) as npz:
+                meta = json.loads(str(npz["meta"]))
+                result = {
+                    "code": meta["code"],
+                    "data": {name: npz[f"data__{name}"] for name in _DRIVER_CHANNELS},
+                    "t_min": meta["t_min"],
+                    "t_max": meta["t_max"],
+                    "max_lap": meta["max_lap"],
+                    "lap_positions": [None if np.isnan(p) else int(p) for p in npz["lap_positions"]],
+                }
+            print(f"Loaded cached telemetry for driver: {driver_code}")
+            return result
+        except FileNotFoundError:
+            pass  # Need to compute from scratch
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            # A truncated shard surfaces as BadZipFile, which is not an OSError
+            print(f"Warning: corrupt per-driver cache for {driver_code}, recomputing")
+
     try:
         laps_driver = session.laps.pick_drivers(driver_no)
     except fastf1.core.DataNotLoadedError:
@@ -95,17 +207,19 @@ def _process_single_driver(args):
         if lap_tel.empty:
             continue
 
+        # OPTIMIZATION: Extract the ten numeric channels from the DataFrame in
+        # a single to_numpy() pass (one allocation, one dtype conversion)
+        # instead of a per-column round trip through pandas block machinery.
+        # Everything downstream treats these as float anyway; float32 carries
+        # the source data's precision comfortably and halves the bytes moved
+        # through the resample and the cache. Only the time axis stays float64
+        # because it seeds the session-wide interpolation grid.
+        x_lap, y_lap, d_lap, rd_lap, speed_kph_lap, gear_lap, drs_lap, \
+        throttle_lap, brake_lap, rpm_lap = lap_tel[
+            ["X", "Y", "Distance", "RelativeDistance", "Speed",
+             "nGear", "DRS", "Throttle", "Brake", "RPM"]
+        ].to_numpy(dtype=np.float32).T
         t_lap = lap_tel["SessionTime"].dt.total_seconds().to_numpy()
-        x_lap = lap_tel["X"].to_numpy()
-        y_lap = lap_tel["Y"].to_numpy()
-        d_lap = lap_tel["Distance"].to_numpy()
-        rd_lap = lap_tel["RelativeDistance"].to_numpy()
-        speed_kph_lap = lap_tel["Speed"].to_numpy()
-        gear_lap = lap_tel["nGear"].to_numpy()
-        drs_lap = lap_tel["DRS"].to_numpy()
-        throttle_lap = lap_tel["Throttle"].to_numpy()
-        brake_lap = lap_tel["Brake"].to_numpy().astype(float)
-        rpm_lap = lap_tel["RPM"].to_numpy()
 
         # Extract lap timing information
         lap_time = lap.LapTime.total_seconds() if pd.notna(lap.LapTime) else None
@@ -113,28 +227,37 @@ def _process_single_driver(args):
         sector2 = lap.Sector2Time.total_seconds() if pd.notna(lap.Sector2Time) else None
         sector3 = lap.Sector3Time.total_seconds() if pd.notna(lap.Sector3Time) else None
 
-        # Filter out NaN values for robustness
-        d_valid = d_lap[~np.isnan(d_lap)]
+        # Only the first and last valid distance samples are needed, so locate
+        # them on the NaN mask instead of materializing a filtered copy:
+        # argmax on a boolean array stops at the first True (NaN runs sit at
+        # the lap edges, if anywhere)
+        d_valid_mask = ~np.isnan(d_lap)
+        first_valid = int(np.argmax(d_valid_mask))
+        has_valid = d_lap.size > 0 and bool(d_valid_mask[first_valid])
 
         # FIRST LAP VALIDATION: Ensure telemetry starts near 0
-        if lap_idx == 0 and len(d_valid) > 0:
-            if d_valid[0] > 100:
-                print(f"WARNING: {driver_code} first lap telemetry starts at {d_valid[0]:.1f}m (expected ~0m)")
+        if lap_idx == 0 and has_valid:
+            if d_lap[first_valid] > 100:
+                print(f"WARNING: {driver_code} first lap telemetry starts at {d_lap[first_valid]:.1f}m (expected ~0m)")
 
         # race distance = distance before this lap + distance within this lap
         race_d_lap = total_dist_so_far + d_lap
 
         # FIX: Update cumulative distance (only with valid data)
-        if len(d_valid) > 1:
-            total_dist_so_far += (d_valid[-1] - d_valid[0])
+        if has_valid:
+            last_valid = len(d_lap) - 1 - int(np.argmax(d_valid_mask[::-1]))
+            if last_valid > first_valid:
+                total_dist_so_far += (d_lap[last_valid] - d_lap[first_valid])
 
         t_all.append(t_lap)
         x_all.append(x_lap)
         y_all.append(y_lap)
         race_dist_all.append(race_d_lap)
         rel_dist_all.append(rd_lap)
-        lap_numbers.append(np.full_like(t_lap, lap_number))
-        tyre_compounds.append(np.full_like(t_lap, tyre_compund_as_int))
+        # OPTIMIZATION: broadcast_to gives a zero-copy view of the scalar;
+        # np.concatenate materializes the real array once at the end
+        lap_numbers.append(np.broadcast_to(np.float32(lap_number), t_lap.shape))
+        tyre_compounds.append(np.broadcast_to(np.float32(tyre_compund_as_int), t_lap.shape))
         speed_all.append(speed_kph_lap)
         gear_all.append(gear_lap)
         drs_all.append(drs_lap)
@@ -144,68 +267,61 @@ def _process_single_driver(args):
 
         # Add lap time and sector times (same value for all points in this lap)
         # Use float with NaN for missing values to enable numpy interpolation
-        lap_times_all.append(np.full_like(t_lap, lap_time if lap_time is not None else np.nan, dtype=float))
-        sector1_all.append(np.full_like(t_lap, sector1 if sector1 is not None else np.nan, dtype=float))
-        sector2_all.append(np.full_like(t_lap, sector2 if sector2 is not None else np.nan, dtype=float))
-        sector3_all.append(np.full_like(t_lap, sector3 if sector3 is not None else np.nan, dtype=float))
+        lap_times_all.append(np.broadcast_to(np.float32(lap_time if lap_time is not None else np.nan), t_lap.shape))
+        sector1_all.append(np.broadcast_to(np.float32(sector1 if sector1 is not None else np.nan), t_lap.shape))
+        sector2_all.append(np.broadcast_to(np.float32(sector2 if sector2 is not None else np.nan), t_lap.shape))
+        sector3_all.append(np.broadcast_to(np.float32(sector3 if sector3 is not None else np.nan), t_lap.shape))
 
     if not t_all:
         return None
 
-    # OPTIMIZATION: Pre-sort lap intervals before concatenation to avoid O(2N) memory spike
-    # Collect laps as (start_time, arrays_tuple) and verify monotonicity within each lap
-    intervals = []
-
-    # We need to reconstruct the intervals from the lists we've accumulated
-    # Zip together all lap arrays to create intervals
-    for lap_idx in range(len(t_all)):
-        t_lap = t_all[lap_idx]
-        if len(t_lap) > 0:
-            # INTEGRITY: Assert time is monotonic within lap (allow duplicates at boundaries)
-            assert np.all(t_lap[:-1] <= t_lap[1:]), \
-                f"Non-monotonic lap time for {driver_code} in lap {lap_idx}"
-
-            # Bundle all arrays for this lap
-            arrays = (
-                t_lap, x_all[lap_idx], y_all[lap_idx], race_dist_all[lap_idx],
-                rel_dist_all[lap_idx], lap_numbers[lap_idx], tyre_compounds[lap_idx],
-                speed_all[lap_idx], gear_all[lap_idx], drs_all[lap_idx],
-                throttle_all[lap_idx], brake_all[lap_idx], rpm_all[lap_idx],
-                lap_times_all[lap_idx], sector1_all[lap_idx], sector2_all[lap_idx], sector3_all[lap_idx]
-            )
-            intervals.append((t_lap[0], arrays))  # Sort key = lap start time
-
-    # Sort intervals by start time (small list, typically 50-100 laps)
-    # INTEGRITY: Verify laps are chronological
-    intervals.sort(key=lambda x: x[0])
-
-    # Concatenate pre-sorted intervals (single concatenation operation)
-    if intervals:
-        t_all = np.concatenate([interval[1][0] for interval in intervals])
-        x_all = np.concatenate([interval[1][1] for interval in intervals])
-        y_all = np.concatenate([interval[1][2] for interval in intervals])
-        race_dist_all = np.concatenate([interval[1][3] for interval in intervals])
-        rel_dist_all = np.concatenate([interval[1][4] for interval in intervals])
-        lap_numbers = np.concatenate([interval[1][5] for interval in intervals])
-        tyre_compounds = np.concatenate([interval[1][6] for interval in intervals])
-        speed_all = np.concatenate([interval[1][7] for interval in intervals])
-        gear_all = np.concatenate([interval[1][8] for interval in intervals])
-        drs_all = np.concatenate([interval[1][9] for interval in intervals])
-        throttle_all = np.concatenate([interval[1][10] for interval in intervals])
-        brake_all = np.concatenate([interval[1][11] for interval in intervals])
-        rpm_all = np.concatenate([interval[1][12] for interval in intervals])
-        lap_times_all = np.concatenate([interval[1][13] for interval in intervals])
-        sector1_all = np.concatenate([interval[1][14] for interval in intervals])
-        sector2_all = np.concatenate([interval[1][15] for interval in intervals])
-        sector3_all = np.concatenate([interval[1][16] for interval in intervals])
+    # INTEGRITY: Assert time is monotonic within each lap (allow duplicates at boundaries)
+    for lap_idx, t_lap in enumerate(t_all):
+        assert _is_monotonic(t_lap), \
+            f"Non-monotonic lap time for {driver_code} in lap {lap_idx}"
+
+    # iterlaps() yields laps chronologically and telemetry within each lap is
+    # monotonic, so the laps are already ordered. Verify cheaply and only
+    # reorder in the (never observed) out-of-order case.
+    order = list(range(len(t_all)))
+    if len(t_all) > 1:
+        starts = np.fromiter((t_lap[0] for t_lap in t_all), dtype=float)
+        if not np.all(starts[:-1] <= starts[1:]):
+            _debug_log(f"[{driver_code}] Lap intervals out of order, sorting")
+            order.sort(key=lambda k: t_all[k][0])
+
+    # Join the per-lap segments channel by channel. The total length is known
+    # up front, so allocate each output buffer once and copy every lap segment
+    # straight into its slice (the broadcast views from above are materialized
+    # here, exactly once).
+    offsets = np.zeros(len(order) + 1, dtype=np.intp)
+    np.cumsum([t_all[k].shape[0] for k in order], out=offsets[1:])
+    total = offsets[-1]
+
+    def _join_channel(lap_arrays):
+        out = np.empty(total, dtype=lap_arrays[0].dtype)
+        for j, k in enumerate(order):
+            out[offsets[j]:offsets[j + 1]] = lap_arrays[k]
+        return out
+
+    t_all, x_all, y_all, race_dist_all, rel_dist_all, lap_numbers, \
+    tyre_compounds, speed_all, gear_all, drs_all, throttle_all, brake_all, \
+    rpm_all, lap_times_all, sector1_all, sector2_all, sector3_all = (
+        _join_channel(lap_arrays) for lap_arrays in (
+            t_all, x_all, y_all, race_dist_all, rel_dist_all, lap_numbers,
+            tyre_compounds, speed_all, gear_all, drs_all, throttle_all,
+            brake_all, rpm_all, lap_times_all, sector1_all, sector2_all,
+            sector3_all,
+        )
+    )
 
     # INTEGRITY: Verify concatenated time is monotonic (allow duplicates at lap boundaries)
-    assert np.all(t_all[:-1] <= t_all[1:]), \
+    assert _is_monotonic(t_all), \
         f"Non-monotonic concatenated time for {driver_code}"
 
     print(f"Completed telemetry for driver: {driver_code}")
-    
-    return {
+
+    result = {
         "code": driver_code,
         "data": {
             "t": t_all,
@@ -232,49 +348,33 @@ def _process_single_driver(args):
         "lap_positions": lap_positions  # List of positions at end of each lap
     }
 
-def _calculate_gaps(sorted_codes, frame_data):
-    """Calculate gap to car ahead and gap to leader for all drivers.
-
-    Returns: dict mapping driver_code -> {"gap_to_previous": float, "gap_to_leader": float}
-    """
-    gaps = {}
-
-    def distance_to_time_gap(distance_diff, speed_ms):
-        if speed_ms <= 0 or distance_diff <= 0:
-            return 0.0
-        return distance_diff / speed_ms
-
-    leader_code = sorted_codes[0] if sorted_codes else None
-    leader_data = frame_data.get(leader_code) if leader_code else None
-
-    for idx, code in enumerate(sorted_codes):
-        data = frame_data[code]
-        gap_to_previous = 0.0
-        gap_to_leader = 0.0
-
-        current_speed_ms = (data["speed"] * 1000) / 3600
-
-        if idx > 0:
-            # Calculate gap to car ahead
-            prev_code = sorted_codes[idx - 1]
-            prev_data = frame_data[prev_code]
-            dist_diff = prev_data["race_progress"] - data["race_progress"]
-            if dist_diff > 0 and current_speed_ms > 0:
-                gap_to_previous = distance_to_time_gap(dist_diff, current_speed_ms)
-
-            # Calculate gap to leader (only for non-leader drivers)
-            if leader_data:
-                dist_diff = leader_data["race_progress"] - data["race_progress"]
-                if dist_diff > 0 and current_speed_ms > 0:
-                    gap_to_leader = distance_to_time_gap(dist_diff, current_speed_ms)
-        # else: leader has gap_to_previous = 0 and gap_to_leader = 0, which will display as "LEADER"
-
-        gaps[code] = {
-            "gap_to_previous": gap_to_previous,
-            "gap_to_leader": gap_to_leader,
+    try:
+        shard_dir.mkdir(parents=True, exist_ok=True)
+        # float32 halves the shard size; keep the time axis at float64 since it
+        # seeds the interpolation grid for the whole session
+        flat = {
+            f"data__{name}": (arr if name == "t" else arr.astype(np.float32, copy=False))
+            for name, arr in result["data"].items()
         }
+        flat["lap_positions"] = np.array(
+            [np.nan if p is None else p for p in lap_positions], dtype=float
+        )
+        flat["meta"] = np.array(json.dumps({
+            "code": driver_code,
+            "t_min": float(result["t_min"]),
+            "t_max": float(result["t_max"]),
+            "max_lap": int(result["max_lap"]),
+        }))
+        # Write via a temp file and rename so an interrupted save can never
+        # leave a truncated shard at the final path
+        tmp_file = shard_file.with_suffix(".npz.tmp")
+        with open(tmp_file, "wb") as f:
+            np.savez(f, **flat)
+        os.replace(tmp_file, shard_file)
+    except OSError as e:
+        print(f"Warning: could not write per-driver cache for {driver_code}: {e}")
 
-    return gaps
+    return result
 
 def _smooth_interval_data(stream_data: pd.DataFrame, window_length: int = 7, polyorder: int = 2) -> pd.DataFrame:
     """
@@ -307,8 +407,24 @@ def _smooth_interval_data(stream_data: pd.DataFrame, window_length: int = 7, pol
         return smoothed
 
     intervals_s = smoothed["Interval_s"].values
-
-    for driver_code, driver_indices in smoothed.groupby("Driver").groups.items():
+    drivers = smoothed["Driver"].values
+
+    # Group rows per driver with one stable sort over factorized codes and
+    # slice contiguous runs, instead of groupby plus a .loc indexer per
+    # driver. Results accumulate in a single output array written back once.
+    out = np.full(len(smoothed), np.nan)
+    codes, _ = pd.factorize(smoothed["Driver"])
+    order = np.argsort(codes, kind="stable")
+    sorted_codes = codes[order]
+    # factorize marks missing drivers as -1; skip them like groupby does
+    first_valid = np.searchsorted(sorted_codes, 0, side="left")
+    order = order[first_valid:]
+    boundaries = np.flatnonzero(np.diff(sorted_codes[first_valid:]) != 0) + 1
+
+    for driver_indices in np.split(order, boundaries):
+        if driver_indices.size == 0:
+            continue
+        driver_code = drivers[driver_indices[0]]
         driver_intervals = intervals_s[driver_indices]
         valid_mask = ~np.isnan(driver_intervals)
 
@@ -323,13 +439,14 @@ def _smooth_interval_data(stream_data: pd.DataFrame, window_length: int = 7, pol
                         window_length=safe_window,
                         polyorder=polyorder
                     )
-                smoothed.loc[driver_indices, "Interval_smooth"] = smoothed_intervals
+                out[driver_indices] = smoothed_intervals
             except Exception as e:
                 print(f"Warning: Could not smooth interval data for {driver_code}: {e}")
-                smoothed.loc[driver_indices, "Interval_smooth"] = driver_intervals
+                out[driver_indices] = driver_intervals
         else:
-            smoothed.loc[driver_indices, "Interval_smooth"] = driver_intervals
+            out[driver_indices] = driver_intervals
 
+    smoothed["Interval_smooth"] = out
     return smoothed
 
 
@@ -380,6 +497,7 @@ class PositionSmoothing:
         """Initialize empty previous order and last change times."""
         self.previous_order: list[str] = []
         self.last_change_time: dict[str, float] = {}
+        self._prev_index: dict[str, int] = {}
 
     def _get_threshold(self, track_status: str) -> float:
         """
@@ -420,54 +538,42 @@ class PositionSmoothing:
         """
         if not self.previous_order:
             self.previous_order = sorted_codes.copy()
+            self._prev_index = {code: idx for idx, code in enumerate(sorted_codes)}
             return sorted_codes
 
         hysteresis_threshold = self._get_threshold(track_status)
 
-        # Map each driver to its position in current and previous orders
-        current_pos = {code: idx for idx, code in enumerate(sorted_codes)}
-        previous_pos = {code: idx for idx, code in enumerate(self.previous_order)}
-
-        # Track drivers that have "accepted" position changes
-        accepted_changes: dict[str, bool] = {}
+        # Previous positions come from the cached index (rebuilt only when the
+        # order actually changed); the current index is just the enumeration.
+        # Only rejected changes need tracking — everything else is accepted.
+        prev_index = self._prev_index
+        rejected: set[str] = set()
 
-        for code in sorted_codes:
-            prev_idx = previous_pos.get(code, -1)
-            curr_idx = current_pos[code]
+        for curr_idx, code in enumerate(sorted_codes):
+            prev_idx = prev_index.get(code, -1)
 
             if prev_idx == -1 or prev_idx == curr_idx:
                 # New driver or same position: always accept
-                accepted_changes[code] = True
+                continue
+            # Position changed: check if enough time has passed
+            time_since_last_change = current_time - self.last_change_time.get(code, 0.0)
+            if time_since_last_change >= hysteresis_threshold:
+                self.last_change_time[code] = current_time
             else:
-                # Position changed: check if enough time has passed
-                time_since_last_change = current_time - self.last_change_time.get(code, 0.0)
-                if time_since_last_change >= hysteresis_threshold:
-                    accepted_changes[code] = True
-                    self.last_change_time[code] = current_time
-                else:
-                    # Not enough time: keep driver in previous position
-                    accepted_changes[code] = False
-
-        # Build smoothed order: keep drivers that haven't been accepted in their previous positions
-        smoothed_order: list[str] = []
-        remaining_drivers = set(sorted_codes)
-
-        for prev_idx, prev_code in enumerate(self.previous_order):
-            if prev_code not in remaining_drivers:
-                continue  # Driver was retired/removed
-
-            curr_accepted = accepted_changes.get(prev_code, True)
-            if not curr_accepted:
-                # Driver not accepted position change, keep in previous position
-                smoothed_order.append(prev_code)
-                remaining_drivers.remove(prev_code)
-
-        # Add all remaining drivers (those with accepted changes) in their new order
-        for code in sorted_codes:
-            if code in remaining_drivers:
-                smoothed_order.append(code)
-                remaining_drivers.remove(code)
+                # Not enough time: keep driver in previous position
+                rejected.add(code)
+
+        # Build smoothed order: drivers with rejected changes hold their
+        # previous slots (in previous order), then everyone else follows in
+        # the new order
+        if rejected:
+            smoothed_order = [code for code in self.previous_order if code in rejected]
+            smoothed_order += [code for code in sorted_codes if code not in rejected]
+        else:
+            smoothed_order = list(sorted_codes)
 
+        if smoothed_order != self.previous_order:
+            self._prev_index = {code: idx for idx, code in enumerate(smoothed_order)}
         self.previous_order = smoothed_order.copy()
         return smoothed_order
 
@@ -502,24 +608,26 @@ def _apply_lap_anchor(
     for code in sorted_codes:
         current_lap = frame_data_raw.get(code, {}).get("lap")
 
-        if (code in lap_boundaries and
-            current_lap is not None and
-            current_lap in lap_boundaries[code]):
-            official_position = lap_boundaries[code][current_lap]
-            lap_snap_corrections[code] = official_position
-        else:
-            lap_snap_corrections[code] = None
+        # Single .get per level instead of a membership test plus a lookup
+        official_position = None
+        if current_lap is not None:
+            driver_laps = lap_boundaries.get(code)
+            if driver_laps is not None:
+                official_position = driver_laps.get(current_lap)
+        lap_snap_corrections[code] = official_position
 
     has_anchors = any(snap is not None for snap in lap_snap_corrections.values())
 
     if not has_anchors:
         return sorted_codes
 
+    idx_map = {code: idx for idx, code in enumerate(sorted_codes)}
+
     def snap_sort_key(code: str) -> tuple:
         if lap_snap_corrections[code] is not None:
             return (0, lap_snap_corrections[code])
         else:
-            return (1, sorted_codes.index(code))
+            return (1, idx_map[code])
 
     sorted_codes = sorted(sorted_codes, key=snap_sort_key)
     return sorted_codes
@@ -597,6 +705,70 @@ def _detect_retirement(code: str, frame_data_raw: dict) -> bool:
 
     return False
 
+def _resample_weather(weather_df, timeline, global_t_min):
+    """
+    Resample the session weather channels onto the playback timeline.
+
+    All channels share the same time base, so one batched interp1d call
+    replaces six separate np.interp lookups over the same weather_times.
+    Returns a dict of per-channel arrays (None for missing columns), or
+    None if there are no weather samples.
+    """
+    weather_times = weather_df["Time"].dt.total_seconds().to_numpy() - global_t_min
+    if len(weather_times) == 0:
+        return None
+    order = np.argsort(weather_times)
+    weather_times = weather_times[order]
+    # Keep the last sample of each duplicated timestamp: np.interp (which
+    # this interpolation replaced) uses the last duplicate at and beyond the
+    # duplicated point
+    keep = np.concatenate((weather_times[:-1] != weather_times[1:], [True]))
+    weather_times = weather_times[keep]
+
+    channels = {
+        "track_temp": "TrackTemp",
+        "air_temp": "AirTemp",
+        "humidity": "Humidity",
+        "wind_speed": "WindSpeed",
+        "wind_direction": "WindDirection",
+        "rainfall": "Rainfall",
+    }
+    resampled = {key: None for key in channels}
+    present = [(key, col) for key, col in channels.items() if col in weather_df]
+    if present:
+        stacked = np.stack(
+            [weather_df[col].to_numpy(dtype=float)[order][keep] for _, col in present]
+        )
+        if len(weather_times) == 1:
+            values = np.repeat(stacked, len(timeline), axis=1)
+        else:
+            # clamp out-of-range queries to the edge samples, matching np.interp
+            values = interp1d(
+                weather_times,
+                stacked,
+                axis=1,
+                assume_sorted=True,
+                copy=False,
+                bounds_error=False,
+                fill_value=(stacked[:, 0], stacked[:, -1]),
+            )(timeline)
+        for row, (key, _) in zip(values, present):
+            resampled[key] = row
+    return resampled
+
+def _weather_change_mask(weather_resampled, num_frames):
+    """
+    Per-frame mask of where any weather channel changes value. Weather is
+    sampled around 1Hz, so the mask is sparse; frame builders use it to reuse
+    the previous snapshot dict instead of allocating a fresh one per frame.
+    """
+    changed = np.zeros(num_frames, dtype=bool)
+    changed[0] = True
+    for values in weather_resampled.values():
+        if values is not None:
+            changed[1:] |= values[1:] != values[:-1]
+    return changed
+
 def get_race_telemetry(session, session_type='R', refresh=False, progress_callback=None):
 
     event_name = str(session).replace(' ', '_')
@@ -653,6 +825,7 @@ def get_race_telemetry(session, session_type='R', refresh=False, progress_callba
             _debug_log(f"  Position {pos}: {code}")
 
     # STEP 1: Load timing data from FIA timing tower
+    timing_wide = None
     timing_gap_df = None
     timing_pos_df = None
     try:
@@ -666,22 +839,25 @@ def get_race_telemetry(session, session_type='R', refresh=False, progress_callba
             print("No stream timing data available for smoothing")
 
         timing = stream_data.reset_index()
-        timing_gap_df = timing.pivot(index="Date", columns="Driver", values="GapToLeader_s")
-        timing_pos_df = timing.pivot(index="Date", columns="Driver", values="Position")
-        timing_interval_smooth_df = timing.pivot(index="Date", columns="Driver", values="Interval_smooth")
+        # One pivot over all three value columns, so the index conversion and
+        # the ffill/bfill pass each run once instead of per pivot
+        timing_wide = timing.pivot(
+            index="Date", columns="Driver",
+            values=["GapToLeader_s", "Position", "Interval_smooth"],
+        )
 
-        base_time = timing_gap_df.index[0]
-        timing_gap_df.index = (timing_gap_df.index - base_time).total_seconds()
-        timing_pos_df.index = timing_gap_df.index
-        timing_interval_smooth_df.index = timing_gap_df.index
+        base_time = timing_wide.index[0]
+        timing_wide.index = (timing_wide.index - base_time).total_seconds()
+        timing_wide = timing_wide.ffill().bfill()
 
-        timing_gap_df = timing_gap_df.ffill().bfill()
-        timing_pos_df = timing_pos_df.ffill().bfill()
-        timing_interval_smooth_df = timing_interval_smooth_df.ffill().bfill()
+        timing_gap_df = timing_wide["GapToLeader_s"]
+        timing_pos_df = timing_wide["Position"]
+        timing_interval_smooth_df = timing_wide["Interval_smooth"]
 
-        print(f"Loaded FIA timing data with {len(timing_gap_df)} samples")
+        print(f"Loaded FIA timing data with {len(timing_wide)} samples")
     except Exception as e:
         print(f"Warning: Could not load FIA timing data: {e}")
+        timing_wide = None
         timing_gap_df = None
         timing_pos_df = None
         timing_interval_smooth_df = None
@@ -697,17 +873,15 @@ def get_race_telemetry(session, session_type='R', refresh=False, progress_callba
     # 1. Get all of the drivers telemetry data using multiprocessing
     # Prepare arguments for parallel processing
     print(f"Processing {len(drivers)} drivers in parallel...")
-    driver_args = [(driver_no, session, driver_codes[driver_no]) for driver_no in drivers]
+    driver_args = [(driver_no, driver_codes[driver_no], refresh) for driver_no in drivers]
 
     num_processes = min(cpu_count(), len(drivers))
 
-    # Auto-tune chunk size for optimal load distribution
-    # Aim for 4-8 chunks per worker for balanced load distribution
-    num_drivers = len(drivers)
-    chunksize = max(1, (num_drivers + num_processes * 4 - 1) // (num_processes * 4))
-
-    with Pool(processes=num_processes) as pool:
-        results = pool.imap_unordered(_process_single_driver, driver_args, chunksize=chunksize)
+    # chunksize=1: per-driver workloads are wildly uneven (a lap-5 retirement
+    # vs a full race distance), so the finest granularity minimizes the wait
+    # for the slowest worker
+    with Pool(processes=num_processes, initializer=_init_worker, initargs=(session,)) as pool:
+        results = pool.imap_unordered(_process_single_driver, driver_args, chunksize=1)
 
         # Process results while pool is still active
         for result in results:
@@ -734,17 +908,15 @@ def get_race_telemetry(session, session_type='R', refresh=False, progress_callba
 
     # STEP 2: Align timing data to animation frames
     abs_timeline = timeline + global_t_min
-    if timing_gap_df is not None and timing_pos_df is not None:
+    if timing_wide is not None:
         try:
-            timing_gap_df = timing_gap_df.reindex(abs_timeline, method="nearest", tolerance=0.25)
-            timing_gap_df = timing_gap_df.ffill().bfill()
-
-            timing_pos_df = timing_pos_df.reindex(abs_timeline, method="nearest", tolerance=0.25)
-            timing_pos_df = timing_pos_df.ffill().bfill()
+            # Reindex and fill the combined frame once, then re-slice the views
+            timing_wide = timing_wide.reindex(abs_timeline, method="nearest", tolerance=0.25)
+            timing_wide = timing_wide.ffill().bfill()
 
-            if timing_interval_smooth_df is not None:
-                timing_interval_smooth_df = timing_interval_smooth_df.reindex(abs_timeline, method="nearest", tolerance=0.25)
-                timing_interval_smooth_df = timing_interval_smooth_df.ffill().bfill()
+            timing_gap_df = timing_wide["GapToLeader_s"]
+            timing_pos_df = timing_wide["Position"]
+            timing_interval_smooth_df = timing_wide["Interval_smooth"]
 
             print(f"Aligned timing data to {len(abs_timeline)} animation frames")
         except Exception as e:
@@ -762,35 +934,54 @@ def get_race_telemetry(session, session_type='R', refresh=False, progress_callba
         # OPTIMIZATION: Data should already be pre-sorted from _process_single_driver
         # Skip redundant np.argsort() call - this is Bottleneck #4 fix
         # INTEGRITY: Assert data is monotonic (allow duplicates at boundaries)
-        assert np.all(t[:-1] <= t[1:]), \
+        assert _is_monotonic(t), \
             f"Driver {code} data not monotonic in time (pre-sort failed in _process_single_driver)"
 
         t_sorted = t  # No need to sort if pre-sorted
 
         # Resample all channels efficiently
-        # Each channel resampled with shared t_sorted and timeline
-        resampled = [np.interp(timeline, t_sorted, arr) for arr in [
-            data["x"],
-            data["y"],
-            data["dist"],
-            data["rel_dist"],
-            data["lap"],
-            data["tyre"],
-            data["speed"],
-            data["gear"],
-            data["drs"],
-            data["throttle"],
-            data["brake"],
-            data["rpm"],
-        ]]
+        # OPTIMIZATION: np.interp rescans t_sorted (binary search) once per
+        # channel. Compute the sample indices and interpolation weights once
+        # and apply them to all 16 channels with a single broadcasted blend.
+        idx = np.searchsorted(t_sorted, timeline, side='right') - 1
+        idx = np.clip(idx, 0, len(t_sorted) - 2)
+        t0 = t_sorted[idx]
+        span = t_sorted[idx + 1] - t0
+        # Duplicate timestamps at lap boundaries give span == 0; weight 0
+        # keeps the left sample (same value np.interp would return)
+        w = np.where(span > 0, (timeline - t0) / np.where(span > 0, span, 1.0), 0.0)
+        w = np.clip(w, 0.0, 1.0)  # clamp to endpoints outside the data range
+
+        channels = np.stack([data[k] for k in (
+            "x", "y", "dist", "rel_dist", "lap", "tyre", "speed", "gear",
+            "drs", "throttle", "brake", "rpm",
+            "lap_time", "sector1", "sector2", "sector3",
+        )])
+        # Blend in place in the channels' own dtype: the right-sample gather
+        # doubles as the output buffer, so the whole 16-channel blend costs
+        # two (C, N) buffers per driver instead of five float64 temporaries
+        w = w.astype(channels.dtype, copy=False)
+        left_vals = channels[:, idx]
+        blended = channels[:, idx + 1]
+        np.subtract(blended, left_vals, out=blended)
+        np.multiply(blended, w, out=blended)
+        np.add(blended, left_vals, out=blended)
+        # At weight 0 take the left sample directly so NaN neighbours in the
+        # lap/sector columns don't poison exact-sample frames
+        zero_w = w == 0.0
+        blended[:, zero_w] = left_vals[:, zero_w]
+
         x_resampled, y_resampled, dist_resampled, rel_dist_resampled, lap_resampled, \
-        tyre_resampled, speed_resampled, gear_resampled, drs_resampled, throttle_resampled, brake_resampled, rpm_resampled = resampled
+        tyre_resampled, speed_resampled, gear_resampled, drs_resampled, throttle_resampled, \
+        brake_resampled, rpm_resampled, lap_time_resampled, sector1_resampled, \
+        sector2_resampled, sector3_resampled = blended
 
-        # Resample lap and sector times (forward-fill since they don't change smoothly)
-        lap_time_resampled = np.interp(timeline, t_sorted, data["lap_time"], left=np.nan, right=np.nan)
-        sector1_resampled = np.interp(timeline, t_sorted, data["sector1"], left=np.nan, right=np.nan)
-        sector2_resampled = np.interp(timeline, t_sorted, data["sector2"], left=np.nan, right=np.nan)
-        sector3_resampled = np.interp(timeline, t_sorted, data["sector3"], left=np.nan, right=np.nan)
+        # Lap and sector times are undefined outside the driver's own data
+        # range (matches the previous left=np.nan/right=np.nan behaviour)
+        out_of_range = (timeline < t_sorted[0]) | (timeline > t_sorted[-1])
+        if out_of_range.any():
+            for arr in (lap_time_resampled, sector1_resampled, sector2_resampled, sector3_resampled):
+                arr[out_of_range] = np.nan
 
         resampled_data[code] = {
             "t": timeline,
@@ -820,76 +1011,46 @@ def get_race_telemetry(session, session_type='R', refresh=False, progress_callba
     race_start_time = None
     race_start_time_absolute = None
 
-    for status in track_status.to_dict('records'):
-        seconds = timedelta.total_seconds(status['Time'])
-
+    if len(track_status):
         # Track status times are already in session timeline (seconds from session start)
-        # Don't shift by global_t_min - that's only for telemetry normalization
-        start_time = seconds
-        end_time = None
-
-        # Set the end time of the previous status
-
-        if formatted_track_statuses:
-            formatted_track_statuses[-1]['end_time'] = start_time
-
-        formatted_track_statuses.append({
-            'status': status['Status'],
-            'start_time': start_time,
-            'end_time': end_time,
-        })
+        # Don't shift by global_t_min - that's only for telemetry normalization.
+        # Each status runs until the next one starts (None for the last). One
+        # vectorized column pass instead of iterating row records.
+        status_times = track_status['Time'].dt.total_seconds().to_numpy()
+        status_codes = track_status['Status'].tolist()
+        formatted_track_statuses = [
+            {'status': code, 'start_time': start, 'end_time': end}
+            for code, start, end in zip(
+                status_codes, status_times.tolist(), status_times[1:].tolist() + [None]
+            )
+        ]
 
         # Record race start as first "All Clear" status (status code "1")
-        if race_start_time_absolute is None and status['Status'] == "1":
-            race_start_time_absolute = start_time
+        green_idx = np.flatnonzero(np.asarray(status_codes) == "1")
+        if green_idx.size:
+            race_start_time_absolute = status_times[green_idx[0]].item()
 
     # 4.1. Resample weather data onto the same timeline for playback
     weather_resampled = None
     weather_df = getattr(session, "weather_data", None)
     if weather_df is not None and not weather_df.empty:
         try:
-            weather_times = weather_df["Time"].dt.total_seconds().to_numpy() - global_t_min
-            if len(weather_times) > 0:
-                order = np.argsort(weather_times)
-                weather_times = weather_times[order]
-
-                def _maybe_get(name):
-                    return weather_df[name].to_numpy()[order] if name in weather_df else None
-
-                def _resample(series):
-                    if series is None:
-                        return None
-                    return np.interp(timeline, weather_times, series)
-
-                track_temp = _resample(_maybe_get("TrackTemp"))
-                air_temp = _resample(_maybe_get("AirTemp"))
-                humidity = _resample(_maybe_get("Humidity"))
-                wind_speed = _resample(_maybe_get("WindSpeed"))
-                wind_direction = _resample(_maybe_get("WindDirection"))
-                rainfall_raw = _maybe_get("Rainfall")
-                rainfall = _resample(rainfall_raw.astype(float)) if rainfall_raw is not None else None
-
-                weather_resampled = {
-                    "track_temp": track_temp,
-                    "air_temp": air_temp,
-                    "humidity": humidity,
-                    "wind_speed": wind_speed,
-                    "wind_direction": wind_direction,
-                    "rainfall": rainfall,
-                }
+            weather_resampled = _resample_weather(weather_df, timeline, global_t_min)
         except Exception as e:
             print(f"Weather data could not be processed: {e}")
 
     # 5. Build the frames + LIVE LEADERBOARD
-    frames = []
     num_frames = len(timeline)
+    # Frame count is known up front, so fill a preallocated list by index
+    # rather than growing it with append
+    frames = [None] * num_frames
 
     # Pre-extract data references for faster access
     driver_codes = list(resampled_data.keys())
     driver_arrays = {code: resampled_data[code] for code in driver_codes}
+    num_drivers = len(driver_codes)
 
     race_finished = False  # Flag to track once race end is detected
-    last_dist = defaultdict(lambda: -1.0)  # Track monotonicity of dist per driver
 
     # Calculate circuit length from reference lap (fastest lap)
     circuit_length = 0.0
@@ -921,19 +1082,18 @@ def get_race_telemetry(session, session_type='R', refresh=False, progress_callba
         # Start from the cumulative race distance you already built in _process_single_driver
         rp = d["dist"].astype(float).copy()
 
-        # Handle NaNs by forward-fill (or 0 at start)
-        if np.isnan(rp).any():
-            for j in range(len(rp)):
-                if np.isnan(rp[j]):
-                    if j > 0 and not np.isnan(rp[j-1]):
-                        rp[j] = rp[j-1]
-                    else:
-                        rp[j] = 0.0
+        # Handle NaNs by forward-fill (or 0 at start), vectorized: propagate the
+        # index of the last valid sample with np.maximum.accumulate, then gather
+        valid = ~np.isnan(rp)
+        if not valid.all():
+            idx = np.where(valid, np.arange(len(rp)), 0)
+            np.maximum.accumulate(idx, out=idx)
+            rp = rp[idx]
+            rp[~valid.cumsum().astype(bool)] = 0.0  # leading NaNs have no fill source
 
-        # Enforce monotonicity (guard against tiny numeric regressions)
-        for j in range(1, len(rp)):
-            if rp[j] < rp[j - 1]:
-                rp[j] = rp[j - 1]
+        # Enforce monotonicity (guard against tiny numeric regressions): a
+        # running maximum replaces the per-sample Python loop
+        np.maximum.accumulate(rp, out=rp)
 
         # Normalize to race start: everybody has race_progress = 0 at lights out
         if 0 <= race_start_idx < len(rp):
@@ -946,11 +1106,74 @@ def get_race_telemetry(session, session_type='R', refresh=False, progress_callba
 
         race_progress_all[code] = rp
 
+    # OPTIMIZATION: Stack all drivers' resampled channels into (num_drivers, num_frames)
+    # matrices so retirement, leader selection and the per-frame assembly below run as
+    # bulk NumPy passes instead of millions of per-frame dict lookups and scalar calls.
+    # Discrete channels get integer dtypes (the cast truncates exactly like the
+    # int() conversion the frame loop used to do); continuous channels drop to
+    # float32, which is plenty for coordinates/speeds and halves the footprint.
+    # lap stays float here because it is rounded (not truncated) below.
+    CHANNEL_DTYPES = {
+        "x": np.float32, "y": np.float32, "dist": np.float32,
+        "rel_dist": np.float32, "lap": np.float32, "speed": np.float32,
+        "throttle": np.float32, "brake": np.float32,
+        "tyre": np.int8, "gear": np.int8, "drs": np.uint8, "rpm": np.uint16,
+    }
+    channel_mats = {
+        name: np.array([driver_arrays[code][name] for code in driver_codes], dtype=dtype)
+        for name, dtype in CHANNEL_DTYPES.items()
+    }
+    progress_mat = np.stack([race_progress_all[code] for code in driver_codes])
+    speed_mat = channel_mats["speed"]
+
+    # Check distance monotonicity per driver in one vectorized pass over the
+    # progress matrix (replaces a per-frame per-driver comparison loop)
+    nonmono = np.diff(progress_mat, axis=1) < -1e-3
+    if nonmono.any():
+        for d_idx, f_idx in zip(*np.nonzero(nonmono)):
+            print(
+                f"[WARN] non-monotonic dist for {driver_codes[d_idx]} at t={timeline[f_idx + 1]:.2f}s: "
+                f"{progress_mat[d_idx, f_idx + 1]:.3f} < {progress_mat[d_idx, f_idx]:.3f}",
+                flush=True,
+            )
+
     # Track retirement confirmation: driver must have speed=0 for at least 10 seconds
     # to be marked as retired (avoids false positives from pit stops or pauses)
     RETIREMENT_THRESHOLD = 10  # seconds with speed == 0
-    driver_zero_speed_time = defaultdict(float)  # Track continuous zero-speed duration per driver
-    driver_retired = defaultdict(bool)  # Track confirmed retirement status
+
+    retired_mat = _detect_retirement_mat(speed_mat, DT, RETIREMENT_THRESHOLD)
+
+    # Leader per frame: highest race progress among non-retired drivers
+    masked_progress = np.where(retired_mat, -np.inf, progress_mat)
+    leader_idx_per_frame = np.argmax(masked_progress, axis=0)
+    any_active_per_frame = ~retired_mat.all(axis=0)
+
+    # Bulk-convert the matrices to nested Python lists once: ndarray.tolist() does the
+    # numpy->native-scalar conversion in C, replacing per-frame float()/int() calls.
+    # Integer channels keep the truncation/rounding behavior of the old scalar casts.
+    float_lists = {
+        name: channel_mats[name].tolist()
+        for name in ("x", "y", "dist", "rel_dist", "speed", "throttle", "brake")
+    }
+    int_lists = {
+        "lap": np.round(channel_mats["lap"]).astype(int).tolist(),
+        "tyre": channel_mats["tyre"].tolist(),
+        "gear": channel_mats["gear"].tolist(),
+        "drs": channel_mats["drs"].tolist(),
+        "rpm": channel_mats["rpm"].tolist(),
+    }
+    progress_lists = progress_mat.tolist()
+    retired_lists = retired_mat.tolist()
+
+    # Lap and sector times carry NaN for "no value"; convert to None once here
+    # instead of a scalar np.isnan round trip per driver per frame (NaN is the
+    # only float that compares unequal to itself)
+    time_lists = {}
+    for name in ("lap_time", "sector1", "sector2", "sector3"):
+        mat = np.stack([driver_arrays[code][name] for code in driver_codes])
+        time_lists[name] = [
+            [v if v == v else None for v in row] for row in mat.tolist()
+        ]
 
     # Calculate total race distance and finish epsilon
     total_race_distance = circuit_length * max_lap_number
@@ -986,12 +1209,103 @@ def get_race_telemetry(session, session_type='R', refresh=False, progress_callba
     print(f"  Estimated time: {estimated_time_seconds:.0f}-{estimated_time_seconds*3:.0f}s (1-3ms per frame)")
     print(f"  Progress every 250 frames (~{estimated_time_seconds/num_frames*250:.1f}s)\n", flush=True)
 
-    # Precompute column indices for timing_pos_df for O(1) lookups
-    pos_col_idx = {}
+    # Convert the frame-aligned timing columns to native-scalar lists once,
+    # so the frame loop indexes plain lists instead of doing a pandas .at/.iat
+    # lookup per driver per frame (NaN becomes None, positions become ints)
+    gap_lists = {}
+    interval_lists = {}
+    pos_lists = {}
+    if timing_gap_df is not None:
+        for code in driver_codes:
+            if code in timing_gap_df.columns:
+                gap_lists[code] = [
+                    None if v != v else v
+                    for v in timing_gap_df[code].to_numpy(dtype=float).tolist()
+                ]
+    if timing_interval_smooth_df is not None:
+        for code in driver_codes:
+            if code in timing_interval_smooth_df.columns:
+                interval_lists[code] = [
+                    None if v != v else v
+                    for v in timing_interval_smooth_df[code].to_numpy(dtype=float).tolist()
+                ]
     if timing_pos_df is not None:
         for code in driver_codes:
             if code in timing_pos_df.columns:
-                pos_col_idx[code] = timing_pos_df.columns.get_loc(code)
+                pos_lists[code] = [
+                    None if v != v else int(v)
+                    for v in timing_pos_df[code].to_numpy(dtype=float).tolist()
+                ]
+
+    # Record the final per-frame ordering so gaps can be computed in one
+    # vectorized pass after the loop. The ordering itself has to stay inside
+    # the loop because Tier 3 hysteresis smoothing is stateful across frames.
+    code_to_idx = {code: d_idx for d_idx, code in enumerate(driver_codes)}
+    order_mat = np.empty((num_drivers, num_frames), dtype=np.intp)
+
+    # Precompute the 3-tier sort keys as (driver, frame) matrices from the
+    # frame-aligned timing data, mirroring sort_key_hybrid's None/NaN handling:
+    # missing or non-positive stream positions and missing intervals become
+    # 9999 so they sort last within their tier.
+    pos_key_mat = np.full((num_drivers, num_frames), 9999.0)
+    interval_key_mat = np.full((num_drivers, num_frames), 9999.0)
+    if timing_pos_df is not None:
+        for code in pos_lists:
+            vals = timing_pos_df[code].to_numpy(dtype=float)
+            d_idx = code_to_idx[code]
+            pos_key_mat[d_idx] = np.where(np.isnan(vals) | (vals <= 0), 9999.0, vals)
+        if timing_interval_smooth_df is not None:
+            for code in driver_codes:
+                if code in timing_interval_smooth_df.columns:
+                    vals = timing_interval_smooth_df[code].to_numpy(dtype=float)
+                    interval_key_mat[code_to_idx[code]] = np.where(np.isnan(vals), 9999.0, vals)
+    neg_progress_key_mat = -np.where(np.isnan(progress_mat), 0.0, progress_mat)
+
+    # Per-frame scalar time math pulled out of the loop: round once for the
+    # payload and precompute the absolute-time lookups as native floats
+    ts_rounded = np.round(timeline, 3).tolist()
+    abs_ts = (timeline + global_t_min).tolist()
+
+    weather_changed = _weather_change_mask(weather_resampled, num_frames) if weather_resampled else None
+    last_weather_snapshot = {}
+
+    # Resolve the active track status for every frame up front with one binary
+    # search instead of scanning the status records inside the loop. Statuses
+    # are contiguous with inclusive ends, so a frame exactly on a boundary
+    # belongs to the earlier record (side='left' then step back one).
+    if formatted_track_statuses:
+        status_starts = np.array([s['start_time'] for s in formatted_track_statuses])
+        abs_ts_arr = np.asarray(abs_ts)
+        status_idx_all = np.searchsorted(status_starts, abs_ts_arr, side='left') - 1
+        status_idx_all[(status_idx_all < 0) & (abs_ts_arr >= status_starts[0])] = 0
+        frame_track_statuses = [
+            '1' if j < 0 else formatted_track_statuses[j]['status']
+            for j in status_idx_all.tolist()
+        ]
+    else:
+        frame_track_statuses = ['1'] * num_frames
+
+    # Bind every per-driver channel list to a positional tuple once so the
+    # frame loop indexes by integer only — no string-keyed dict lookups per
+    # driver per frame (the timing lists may lack some drivers, hence .get)
+    per_driver_channels = [
+        (
+            float_lists["x"][d_idx], float_lists["y"][d_idx],
+            float_lists["dist"][d_idx], int_lists["lap"][d_idx],
+            float_lists["rel_dist"][d_idx], progress_lists[d_idx],
+            int_lists["tyre"][d_idx], float_lists["speed"][d_idx],
+            int_lists["gear"][d_idx], int_lists["drs"][d_idx],
+            float_lists["throttle"][d_idx], float_lists["brake"][d_idx],
+            int_lists["rpm"][d_idx], time_lists["lap_time"][d_idx],
+            time_lists["sector1"][d_idx], time_lists["sector2"][d_idx],
+            time_lists["sector3"][d_idx],
+        )
+        for d_idx in range(num_drivers)
+    ]
+    per_driver_timing = [
+        (gap_lists.get(code), interval_lists.get(code), pos_lists.get(code))
+        for code in driver_codes
+    ]
 
     for i in range(num_frames):
         if i % 250 == 0:
@@ -1004,84 +1318,56 @@ def get_race_telemetry(session, session_type='R', refresh=False, progress_callba
                     print(f"[FRAMES] Warning: Progress callback failed: {e}", flush=True)
 
         t = timeline[i]
-        t_abs = t + global_t_min  # Convert to absolute session seconds for race-start comparison
+        t_abs = abs_ts[i]  # Absolute session seconds for race-start comparison
 
-        # OPTIMIZATION: Build data for all drivers in one pass (no intermediate snapshot list)
+        # OPTIMIZATION: Build data for all drivers in one pass from the pre-converted
+        # column lists (native Python scalars, no per-field float()/int() boxing)
         frame_data_raw = {}
 
-        for code in driver_codes:
-            d = driver_arrays[code]
-            race_prog = race_progress_all[code][i]
-            speed = float(d['speed'][i])
-
+        for d_idx, code in enumerate(driver_codes):
+            (x_l, y_l, dist_l, lap_l, rel_dist_l, prog_l, tyre_l, speed_l,
+             gear_l, drs_l, throttle_l, brake_l, rpm_l, lap_time_l,
+             sector1_l, sector2_l, sector3_l) = per_driver_channels[d_idx]
             frame_data_raw[code] = {
-                "x": float(d["x"][i]),
-                "y": float(d["y"][i]),
-                "dist": float(d["dist"][i]),
-                "lap": int(round(d["lap"][i])),
-                "rel_dist": float(d["rel_dist"][i]),
-                "race_progress": float(race_prog),
-                "tyre": int(d["tyre"][i]),
-                "speed": speed,
-                "gear": int(d['gear'][i]),
-                "drs": int(d['drs'][i]),
-                "throttle": float(d['throttle'][i]),
-                "brake": float(d['brake'][i]),
-                "rpm": int(d['rpm'][i]),
-                "lap_time": float(d["lap_time"][i]) if not np.isnan(d["lap_time"][i]) else None,
-                "sector1": float(d["sector1"][i]) if not np.isnan(d["sector1"][i]) else None,
-                "sector2": float(d["sector2"][i]) if not np.isnan(d["sector2"][i]) else None,
-                "sector3": float(d["sector3"][i]) if not np.isnan(d["sector3"][i]) else None,
+                "x": x_l[i],
+                "y": y_l[i],
+                "dist": dist_l[i],
+                "lap": lap_l[i],
+                "rel_dist": rel_dist_l[i],
+                "race_progress": prog_l[i],
+                "tyre": tyre_l[i],
+                "speed": speed_l[i],
+                "gear": gear_l[i],
+                "drs": drs_l[i],
+                "throttle": throttle_l[i],
+                "brake": brake_l[i],
+                "rpm": rpm_l[i],
+                "lap_time": lap_time_l[i],
+                "sector1": sector1_l[i],
+                "sector2": sector2_l[i],
+                "sector3": sector3_l[i],
             }
 
-            # STEP 3: Inject timing data into frame
-            if timing_gap_df is not None and timing_pos_df is not None:
-                try:
-                    gap = timing_gap_df.at[t_abs, code]
-                    frame_data_raw[code]["gap"] = float(gap) if not pd.isna(gap) else None
+            # STEP 3: Inject timing data into frame (pre-converted lists; None
+            # where the stream has no column for this driver)
+            code_gaps, code_intervals, code_pos = per_driver_timing[d_idx]
+            frame_data_raw[code]["gap"] = code_gaps[i] if code_gaps is not None else None
+            frame_data_raw[code]["interval_smooth"] = code_intervals[i] if code_intervals is not None else None
 
-                    if timing_interval_smooth_df is not None:
-                        interval_smooth = timing_interval_smooth_df.at[t_abs, code]
-                        frame_data_raw[code]["interval_smooth"] = float(interval_smooth) if not pd.isna(interval_smooth) else None
-                    else:
-                        frame_data_raw[code]["interval_smooth"] = None
-                except (KeyError, TypeError):
-                    frame_data_raw[code]["gap"] = None
-                    frame_data_raw[code]["interval_smooth"] = None
-            else:
-                frame_data_raw[code]["gap"] = None
-                frame_data_raw[code]["interval_smooth"] = None
-
-            # Phase 6: Extract stream position from pre-aligned timing_pos_df (optimized)
-            # Use precomputed column indices with .iat for O(1) lookups instead of O(D)
-            if timing_pos_df is not None and code in pos_col_idx:
-                try:
-                    col_idx = pos_col_idx[code]
-                    stream_pos = timing_pos_df.iat[i, col_idx]
-                    frame_data_raw[code]["pos_raw"] = int(stream_pos) if not pd.isna(stream_pos) else None
-                except (KeyError, IndexError):
-                    frame_data_raw[code]["pos_raw"] = None
-            else:
-                frame_data_raw[code]["pos_raw"] = None
-
-            # Track retirement: update zero-speed duration
-            if speed == 0:
-                driver_zero_speed_time[code] += DT
-                if driver_zero_speed_time[code] >= RETIREMENT_THRESHOLD:
-                    driver_retired[code] = True
-            else:
-                driver_zero_speed_time[code] = 0  # Reset if driver has any speed
+            # Phase 6: Stream position from the pre-aligned, pre-converted lists
+            frame_data_raw[code]["pos_raw"] = code_pos[i] if code_pos is not None else None
 
             # Set status based on current retirement state (not final race result)
-            frame_data_raw[code]["status"] = "Retired" if driver_retired[code] else "Finished"
+            frame_data_raw[code]["status"] = "Retired" if retired_lists[d_idx][i] else "Finished"
 
-        # Separate active from retired using consistent driver_retired tracking
-        active_codes = [c for c in driver_codes if not driver_retired[c]]
-        retired_codes = [c for c in driver_codes if driver_retired[c]]
+        # Separate active from retired using the precomputed retirement matrix
+        active_idx = [d_idx for d_idx in range(num_drivers) if not retired_lists[d_idx][i]]
+        active_codes = [driver_codes[d_idx] for d_idx in active_idx]
+        retired_codes = [c for d_idx, c in enumerate(driver_codes) if retired_lists[d_idx][i]]
 
-        # IDENTIFY CURRENT LEADER (from active drivers only, using consolidated retirement tracking)
-        if active_codes:
-            current_leader = max(active_codes, key=lambda c: frame_data_raw[c]["race_progress"])
+        # IDENTIFY CURRENT LEADER (from active drivers only, precomputed via argmax)
+        if any_active_per_frame[i]:
+            current_leader = driver_codes[leader_idx_per_frame[i]]
             leader_progress = frame_data_raw[current_leader]["race_progress"]
             leader_lap = frame_data_raw[current_leader]["lap"]
         else:
@@ -1093,26 +1379,26 @@ def get_race_telemetry(session, session_type='R', refresh=False, progress_callba
         if not race_finished and current_leader and leader_progress >= (total_race_distance - FINISH_EPSILON) and final_positions:
             race_finished = True
 
-        # Get current track status for hysteresis threshold
-        current_track_status = '1'  # Default to Green
-        try:
-            for status_record in formatted_track_statuses:
-                start = status_record.get('start_time', 0)
-                end = status_record.get('end_time')
-                if end is None:
-                    end = float('inf')
-                if start <= t_abs <= end:
-                    current_track_status = status_record.get('status', '1')
-                    break
-        except Exception:
-            current_track_status = '1'
-
-        # Phase 5: Use driver_retired dictionary as single source of truth (updated via zero-speed tracking)
+        # Get current track status for hysteresis threshold (precomputed above)
+        current_track_status = frame_track_statuses[i]
+
+        # Phase 5: Use retired_mat as single source of truth (precomputed zero-speed tracking)
         # active_codes and retired_codes already defined after inner driver loop
 
         # STEP 4: HYBRID SORTING (Phase 2, Task 2.2)
-        # Use 3-tier sorting: pos_raw (Tier 1), interval_smooth (Tier 1.5), race_progress (Tier 2)
-        sorted_codes = sorted(active_codes, key=lambda code: sort_key_hybrid(code, frame_data_raw))
+        # Use 3-tier sorting: pos_raw (Tier 1), interval_smooth (Tier 1.5), race_progress (Tier 2).
+        # With frame-aligned timing the keys are precomputed matrix columns and a
+        # stable lexsort replaces the Python sort; sort_key_hybrid stays as the
+        # fallback when timing data could not be aligned to the timeline.
+        if timing_pos_df is not None:
+            order = np.lexsort((
+                neg_progress_key_mat[active_idx, i],
+                interval_key_mat[active_idx, i],
+                pos_key_mat[active_idx, i],
+            ))
+            sorted_codes = [active_codes[j] for j in order]
+        else:
+            sorted_codes = sorted(active_codes, key=lambda code: sort_key_hybrid(code, frame_data_raw))
 
         # Apply hysteresis smoothing (Tier 3)
         sorted_codes = position_smoother.apply(
@@ -1133,10 +1419,12 @@ def get_race_telemetry(session, session_type='R', refresh=False, progress_callba
             top5 = [(code, frame_data_raw[code]['pos_raw'], frame_data_raw[code].get('gap', '?')) for code in sorted_codes[:5]]
             _debug_log(f"t={t_abs:.2f}: {top5}")
 
-        # Calculate positions and gaps for this frame
+        # Calculate positions for this frame. frame_data_raw is rebuilt from the
+        # columnar lists every frame, so annotate it in place instead of paying
+        # for a second dict per driver per frame.
         frame_data = {}
         for pos, code in enumerate(sorted_codes, start=1):
-            frame_data[code] = frame_data_raw[code].copy()
+            frame_data[code] = frame_data_raw[code]
             frame_data[code]["position"] = pos
 
         # DEBUG: Log all driver data at key frames
@@ -1154,26 +1442,8 @@ def get_race_telemetry(session, session_type='R', refresh=False, progress_callba
                 status = frame_data[code]["status"]
                 _debug_log(f"  Position {pos}: {code} - race_progress={prog:.2f}, grid_pos={grid}, lap={lap}, speed={speed:.1f}km/h, tyre={tyre}, gear={gear}, drs={drs}, status={status}")
 
-        # Check distance monotonicity per driver (warns if data is non-monotonic)
-        for code in sorted_codes:
-            progress = frame_data[code]["race_progress"]
-            if progress + 1e-3 < last_dist[code]:
-                print(
-                    f"[WARN] non-monotonic dist for {code} at t={t:.2f}s: "
-                    f"{progress:.3f} < {last_dist[code]:.3f}",
-                    flush=True,
-                )
-            last_dist[code] = progress
-
-        # Calculate gaps for this frame
-        current_gaps = _calculate_gaps(sorted_codes, frame_data)
-
-
-        for code in sorted_codes:
-            # Add gap data (always - every driver should have gap values)
-            gap_data = current_gaps.get(code, {"gap_to_previous": 0.0, "gap_to_leader": 0.0})
-            frame_data[code]["gap_to_previous"] = gap_data["gap_to_previous"]
-            frame_data[code]["gap_to_leader"] = gap_data["gap_to_leader"]
+        # Record the sorted order; gaps are filled in one vectorized pass below
+        order_mat[:, i] = [code_to_idx[code] for code in sorted_codes]
 
         # Get leader info for frame payload
         leader_code = sorted_codes[0] if sorted_codes else None
@@ -1182,32 +1452,60 @@ def get_race_telemetry(session, session_type='R', refresh=False, progress_callba
         weather_snapshot = {}
         if weather_resampled:
             try:
-                wt = weather_resampled
-                rain_val = wt["rainfall"][i] if wt.get("rainfall") is not None else 0.0
-                weather_snapshot = {
-                    "track_temp": float(wt["track_temp"][i]) if wt.get("track_temp") is not None else None,
-                    "air_temp": float(wt["air_temp"][i]) if wt.get("air_temp") is not None else None,
-                    "humidity": float(wt["humidity"][i]) if wt.get("humidity") is not None else None,
-                    "wind_speed": float(wt["wind_speed"][i]) if wt.get("wind_speed") is not None else None,
-                    "wind_direction": float(wt["wind_direction"][i]) if wt.get("wind_direction") is not None else None,
-                    "rain_state": "RAINING" if rain_val and rain_val > 0 else "DRY",
-                }
+                # Build a fresh snapshot only where a channel changed; otherwise
+                # reuse the previous dict (weather is ~1Hz against 25fps frames)
+                if weather_changed[i]:
+                    wt = weather_resampled
+                    rain_val = wt["rainfall"][i] if wt.get("rainfall") is not None else 0.0
+                    weather_snapshot = {
+                        "track_temp": float(wt["track_temp"][i]) if wt.get("track_temp") is not None else None,
+                        "air_temp": float(wt["air_temp"][i]) if wt.get("air_temp") is not None else None,
+                        "humidity": float(wt["humidity"][i]) if wt.get("humidity") is not None else None,
+                        "wind_speed": float(wt["wind_speed"][i]) if wt.get("wind_speed") is not None else None,
+                        "wind_direction": float(wt["wind_direction"][i]) if wt.get("wind_direction") is not None else None,
+                        "rain_state": "RAINING" if rain_val and rain_val > 0 else "DRY",
+                    }
+                    last_weather_snapshot = weather_snapshot
+                else:
+                    weather_snapshot = last_weather_snapshot
             except Exception as e:
                 print(f"Failed to attach weather data to frame {i}: {e}")
 
         frame_payload = {
-            "t": round(t, 3),
+            "t": ts_rounded[i],
             "lap": leader_lap,   # leader's lap at this time
             "drivers": frame_data,
         }
         if weather_snapshot:
             frame_payload["weather"] = weather_snapshot
 
-        frames.append(frame_payload)
+        frames[i] = frame_payload
 
         # Save current sorted order for next frame's pass detection
         prev_sorted_codes = sorted_codes
 
+    # Vectorized gap computation (replaces the per-frame _calculate_gaps loop):
+    # reorder progress/speed by the recorded per-frame ranking, take row
+    # differences for the distance to the car ahead / leader, and convert to
+    # time gaps with a single masked divide.
+    sorted_prog = np.take_along_axis(progress_mat, order_mat, axis=0)
+    sorted_speed_ms = np.take_along_axis(speed_mat, order_mat, axis=0) * (1000.0 / 3600.0)
+    dist_to_prev = np.zeros_like(sorted_prog)
+    dist_to_prev[1:] = sorted_prog[:-1] - sorted_prog[1:]
+    dist_to_leader = sorted_prog[0:1] - sorted_prog
+    valid_speed = sorted_speed_ms > 0
+    safe_speed = np.where(valid_speed, sorted_speed_ms, 1.0)
+    gap_prev_lists = np.where((dist_to_prev > 0) & valid_speed, dist_to_prev / safe_speed, 0.0).tolist()
+    gap_leader_lists = np.where((dist_to_leader > 0) & valid_speed, dist_to_leader / safe_speed, 0.0).tolist()
+    order_lists = order_mat.T.tolist()
+
+    for i, frame in enumerate(frames):
+        drivers = frame["drivers"]
+        for rank, d_idx in enumerate(order_lists[i]):
+            driver = drivers[driver_codes[d_idx]]
+            driver["gap_to_previous"] = gap_prev_lists[rank][i]
+            driver["gap_to_leader"] = gap_leader_lists[rank][i]
+
     print(f"\n[TELEMETRY] Frame generation complete: {len(frames)} frames", flush=True)
     print("completed telemetry extraction...")
     print("Saving to cache file...")
@@ -1216,19 +1514,7 @@ def get_race_telemetry(session, session_type='R', refresh=False, progress_callba
 
     race_start_time = race_start_time_absolute - global_t_min if race_start_time_absolute is not None else None
 
-    # Save using pickle (10-100x faster than JSON)
-    with open(cache_file, "wb") as f:
-        pickle.dump({
-            "frames": frames,
-            "driver_colors": get_driver_colors(session),
-            "track_statuses": formatted_track_statuses,
-            "total_laps": int(max_lap_number),
-            "race_start_time": race_start_time,
-        }, f, protocol=pickle.HIGHEST_PROTOCOL)
-
-    print("Saved Successfully!")
-    print("The replay should begin in a new window shortly")
-    return {
+    result = {
         "frames": frames,
         "driver_colors": get_driver_colors(session),
         "track_statuses": formatted_track_statuses,
@@ -1236,6 +1522,14 @@ def get_race_telemetry(session, session_type='R', refresh=False, progress_callba
         "race_start_time": race_start_time,
     }
 
+    # Save using pickle (10-100x faster than JSON)
+    with open(cache_file, "wb") as f:
+        pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    print("Saved Successfully!")
+    print("The replay should begin in a new window shortly")
+    return result
+
 
 def get_qualifying_results(session):
 
@@ -1245,31 +1539,34 @@ def get_qualifying_results(session):
 
     qualifying_data = []
 
-    for _, row in results.iterrows():
-        driver_code = row["Abbreviation"]
+    # Build the color mapping once instead of once per row
+    driver_colors = get_driver_colors(session)
 
+    # Convert each Timedelta column to seconds in one vectorized pass (NaT
+    # becomes NaN, mapped to None) instead of a pd.isna/total_seconds call per cell
+    def convert_time_column(column) -> list:
+        return [None if v != v else str(v) for v in column.dt.total_seconds().tolist()]
+
+    # Zip plain column lists instead of iterrows (which boxes every row into a Series)
+    rows = zip(
+        results["Abbreviation"].tolist(),
+        results["Position"].tolist(),
+        convert_time_column(results["Q1"]),
+        convert_time_column(results["Q2"]),
+        convert_time_column(results["Q3"]),
+    )
+    for driver_code, position, q1_time, q2_time, q3_time in rows:
         # Skip drivers with no position (didn't participate or were eliminated)
-        if pd.isna(row["Position"]):
+        if pd.isna(position):
             continue
 
-        position = int(row["Position"])
-        q1_time = row["Q1"]
-        q2_time = row["Q2"]
-        q3_time = row["Q3"]
-
-        # Convert pandas Timedelta objects to seconds (or None if NaT)
-        def convert_time_to_seconds(time_val) -> str:
-            if pd.isna(time_val):
-                return None
-            return str(time_val.total_seconds())
-
         qualifying_data.append({
             "code": driver_code,
-            "position": position,
-            "color": get_driver_colors(session).get(driver_code, (128,128,128)),
-            "Q1": convert_time_to_seconds(q1_time),
-            "Q2": convert_time_to_seconds(q2_time),
-            "Q3": convert_time_to_seconds(q3_time),
+            "position": int(position),
+            "color": driver_colors.get(driver_code, (128,128,128)),
+            "Q1": q1_time,
+            "Q2": q2_time,
+            "Q3": q3_time,
         })
     return qualifying_data
 
@@ -1346,11 +1643,14 @@ def get_driver_quali_telemetry(session, driver_code: str, quali_segment: str):
     # Shift telemetry times to same reference as timeline (relative to global_t_min)
     t_rel = t_arr - global_t_min
 
-    # Sort & deduplicate times using the relative times
+    # Sort & deduplicate times using the relative times. The array is already
+    # sorted, so duplicates are adjacent and a linear not-equal mask replaces
+    # np.unique's internal re-sort; the first occurrence is kept either way.
     order = np.argsort(t_rel)
     t_sorted = t_rel[order]
-    t_sorted_unique, unique_idx = np.unique(t_sorted, return_index=True)
-    idx_map = order[unique_idx]
+    keep = np.concatenate(([True], t_sorted[1:] != t_sorted[:-1]))
+    idx_map = order[keep]
+    t_sorted_unique = t_sorted[keep]
 
     x_sorted = x_arr[idx_map]
     y_sorted = y_arr[idx_map]
@@ -1362,150 +1662,138 @@ def get_driver_quali_telemetry(session, driver_code: str, quali_segment: str):
     brake_sorted = brake_arr[idx_map]
     drs_sorted = drs_arr[idx_map]
 
-    # Continuous interpolation
-    x_resampled = np.interp(timeline, t_sorted_unique, x_sorted)
-    y_resampled = np.interp(timeline, t_sorted_unique, y_sorted)
-    dist_resampled = np.interp(timeline, t_sorted_unique, dist_sorted)
-    rel_dist_resampled = np.interp(timeline, t_sorted_unique, rel_dist_sorted)
-    speed_resampled = np.round(np.interp(timeline, t_sorted_unique, speed_sorted), 1)
-    throttle_resampled = np.round(np.interp(timeline, t_sorted_unique, throttle_sorted), 1)
-    brake_resampled = np.round(np.interp(timeline, t_sorted_unique, brake_sorted), 1)
-    drs_resampled = np.interp(timeline, t_sorted_unique, drs_sorted)
+    # Continuous interpolation: stack the channels and interpolate them all in
+    # one interp1d call so the binary search over t_sorted_unique runs once
+    # instead of once per channel. Clamping the query to the data range keeps
+    # np.interp's endpoint behavior.
+    query = np.clip(timeline, t_sorted_unique[0], t_sorted_unique[-1])
+    channel_stack = np.stack([
+        x_sorted, y_sorted, dist_sorted, rel_dist_sorted,
+        speed_sorted, throttle_sorted, brake_sorted, drs_sorted,
+    ])
+    x_resampled, y_resampled, dist_resampled, rel_dist_resampled, \
+    speed_resampled, throttle_resampled, brake_resampled, drs_resampled = interp1d(
+        t_sorted_unique, channel_stack, axis=1, assume_sorted=True, copy=False
+    )(query)
+    speed_resampled = np.round(speed_resampled, 1)
+    throttle_resampled = np.round(throttle_resampled, 1)
+    brake_resampled = np.round(brake_resampled, 1)
 
     # Make sure that braking is between 0 and 100 so that it matches the throttle scale
 
     brake_resampled = brake_resampled * 100.0
 
-    # Forward-fill / step sampling for discrete fields (gear)
-    idxs = np.searchsorted(t_sorted_unique, timeline, side='right') - 1
-    idxs = np.clip(idxs, 0, len(t_sorted_unique) - 1)
-    gear_resampled = gear_sorted[idxs].astype(int)
-
-    resampled_data = {
-        "t": timeline,
-        "x": x_resampled,
-        "y": y_resampled,
-        "dist": dist_resampled,
-        "rel_dist": rel_dist_resampled,
-        "speed": speed_resampled,
-        "gear": gear_resampled,
-        "throttle": throttle_resampled,
-        "brake": brake_resampled,
-        "drs": drs_resampled,
-    }
+    # Forward-fill / step sampling for discrete fields (gear). The timeline is
+    # uniform, so each sample's first visible slot comes from direct division
+    # instead of a binary search per timeline point; a one-step comparison
+    # fix-up absorbs float rounding at exact grid boundaries. Scattering the
+    # sample indices and carrying them forward with a cumulative max then
+    # reproduces the "last sample at or before this frame" lookup.
+    num_slots = len(timeline)
+    slot = np.ceil((t_sorted_unique - timeline[0]) / DT).astype(np.intp)
+    slot = np.clip(slot, 0, num_slots)
+    slot -= ((slot > 0) & (timeline[np.maximum(slot - 1, 0)] >= t_sorted_unique)).astype(np.intp)
+    slot += ((slot < num_slots) & (timeline[np.minimum(slot, num_slots - 1)] < t_sorted_unique)).astype(np.intp)
+    in_range = slot < num_slots
+    last_sample = np.full(num_slots, -1, dtype=np.intp)
+    last_sample[slot[in_range]] = np.flatnonzero(in_range)
+    np.maximum.accumulate(last_sample, out=last_sample)
+    gear_resampled = gear_sorted[np.maximum(last_sample, 0)].astype(int)
 
     track_status = get_track_status(session)
 
-    formatted_track_statuses = []
-
-    for status in track_status.to_dict('records'):
-        seconds = timedelta.total_seconds(status['Time'])
-
-        start_time = seconds - global_t_min # Shift to match timeline
-        end_time = None
-
-        # Set the end time of the previous status
-        if formatted_track_statuses:
-            formatted_track_statuses[-1]['end_time'] = start_time
-
-        formatted_track_statuses.append({
-            'status': status['Status'],
-            'start_time': start_time,
-            'end_time': end_time, 
-        })
+    # Each status runs until the next one starts (None for the last). One
+    # vectorized column pass instead of iterating row records.
+    status_times = track_status['Time'].dt.total_seconds().to_numpy() - global_t_min
+    formatted_track_statuses = [
+        {'status': code, 'start_time': start, 'end_time': end}
+        for code, start, end in zip(
+            track_status['Status'].tolist(),
+            status_times.tolist(),
+            status_times[1:].tolist() + [None],
+        )
+    ]
 
     # 4.1. Resample weather data onto the same timeline for playback
     weather_resampled = None
     weather_df = getattr(session, "weather_data", None)
     if weather_df is not None and not weather_df.empty:
         try:
-            weather_times = weather_df["Time"].dt.total_seconds().to_numpy() - global_t_min
-            if len(weather_times) > 0:
-                order_w = np.argsort(weather_times)
-                weather_times = weather_times[order_w]
-
-                def _maybe_get(name):
-                    return weather_df[name].to_numpy()[order_w] if name in weather_df else None
-
-                def _resample(series):
-                    if series is None:
-                        return None
-                    return np.interp(timeline, weather_times, series)
-
-                track_temp = _resample(_maybe_get("TrackTemp"))
-                air_temp = _resample(_maybe_get("AirTemp"))
-                humidity = _resample(_maybe_get("Humidity"))
-                wind_speed = _resample(_maybe_get("WindSpeed"))
-                wind_direction = _resample(_maybe_get("WindDirection"))
-                rainfall_raw = _maybe_get("Rainfall")
-                rainfall = _resample(rainfall_raw.astype(float)) if rainfall_raw is not None else None
-
-                weather_resampled = {
-                    "track_temp": track_temp,
-                    "air_temp": air_temp,
-                    "humidity": humidity,
-                    "wind_speed": wind_speed,
-                    "wind_direction": wind_direction,
-                    "rainfall": rainfall,
-                }
+            weather_resampled = _resample_weather(weather_df, timeline, global_t_min)
         except Exception as e:
             print(f"Weather data could not be processed: {e}")
 
-    # Build the frames
-    frames = []
+    # Build the frames in bulk: ndarray.tolist() does the numpy->native-scalar
+    # conversion in C, replacing per-frame float()/int() boxing
     num_frames = len(timeline)
-
-    for i in range(num_frames):
-        t = timeline[i]
-
-        weather_snapshot = {}
-        if weather_resampled:
-            try:
-                wt = weather_resampled
-                rain_val = wt["rainfall"][i] if wt.get("rainfall") is not None else 0.0
-                weather_snapshot = {
-                    "track_temp": float(wt["track_temp"][i]) if wt.get("track_temp") is not None else None,
-                    "air_temp": float(wt["air_temp"][i]) if wt.get("air_temp") is not None else None,
-                    "humidity": float(wt["humidity"][i]) if wt.get("humidity") is not None else None,
-                    "wind_speed": float(wt["wind_speed"][i]) if wt.get("wind_speed") is not None else None,
-                    "wind_direction": float(wt["wind_direction"][i]) if wt.get("wind_direction") is not None else None,
-                    "rain_state": "RAINING" if rain_val and rain_val > 0 else "DRY",
-                }
-            except Exception as e:
-                print(f"Failed to attach weather data to frame {i}: {e}")
-
-        # Check if drs has changed from the previous frame
-
-        if i > 0:
-            drs_prev = resampled_data["drs"][i - 1]
-            drs_curr = resampled_data["drs"][i]
-
-            if (drs_curr >= 10) and (drs_prev < 10):
-                # DRS activated
-                lap_drs_zones.append({
-                    "zone_start": float(resampled_data["dist"][i]),
-                    "zone_end": None,
-                })
-            elif (drs_curr < 10) and (drs_prev >= 10):
-                # DRS deactivated
-                if lap_drs_zones and lap_drs_zones[-1]["zone_end"] is None:
-                    lap_drs_zones[-1]["zone_end"] = float(resampled_data["dist"][i])
-
-        frame_payload = {
-            "t": round(t, 3),
-            "x": float(resampled_data["x"][i]),
-            "y": float(resampled_data["y"][i]),
-            "dist": float(resampled_data["dist"][i]),
-            "speed": float(resampled_data["speed"][i]),
-            "gear": int(resampled_data["gear"][i]),
-            "throttle": float(resampled_data["throttle"][i]),
-            "brake": float(resampled_data["brake"][i]),
-            "drs": int(resampled_data["drs"][i]),
+    ts = np.round(timeline, 3).tolist()
+    xs = x_resampled.tolist()
+    ys = y_resampled.tolist()
+    dists = dist_resampled.tolist()
+    speeds = speed_resampled.tolist()
+    gears = gear_resampled.tolist()
+    throttles = throttle_resampled.tolist()
+    brakes = brake_resampled.tolist()
+    drss = drs_resampled.astype(int).tolist()
+
+    frames = [
+        {
+            "t": ts[i],
+            "x": xs[i],
+            "y": ys[i],
+            "dist": dists[i],
+            "speed": speeds[i],
+            "gear": gears[i],
+            "throttle": throttles[i],
+            "brake": brakes[i],
+            "drs": drss[i],
         }
-        if weather_snapshot:
-            frame_payload["weather"] = weather_snapshot
+        for i in range(num_frames)
+    ]
 
-        frames.append(frame_payload)
+    if weather_resampled:
+        try:
+            wt = weather_resampled
+            weather_lists = {
+                name: (wt[name].tolist() if wt.get(name) is not None else None)
+                for name in ("track_temp", "air_temp", "humidity",
+                             "wind_speed", "wind_direction", "rainfall")
+            }
+            rainfall = weather_lists["rainfall"]
+            changed = _weather_change_mask(weather_resampled, num_frames)
+            snapshot = {}
+            for i, frame in enumerate(frames):
+                if changed[i]:
+                    rain_val = rainfall[i] if rainfall is not None else 0.0
+                    snapshot = {
+                        "track_temp": weather_lists["track_temp"][i] if weather_lists["track_temp"] is not None else None,
+                        "air_temp": weather_lists["air_temp"][i] if weather_lists["air_temp"] is not None else None,
+                        "humidity": weather_lists["humidity"][i] if weather_lists["humidity"] is not None else None,
+                        "wind_speed": weather_lists["wind_speed"][i] if weather_lists["wind_speed"] is not None else None,
+                        "wind_direction": weather_lists["wind_direction"][i] if weather_lists["wind_direction"] is not None else None,
+                        "rain_state": "RAINING" if rain_val and rain_val > 0 else "DRY",
+                    }
+                frame["weather"] = snapshot
+        except Exception as e:
+            print(f"Failed to attach weather data to frames: {e}")
+
+    # Detect DRS activation/deactivation edges to mark the lap's DRS zones.
+    # Vectorized: a zone starts on a rising edge of (drs >= 10) and ends on
+    # the next falling edge; edges strictly alternate, so after dropping a
+    # falling edge with no recorded start (lap began with DRS open) the two
+    # index arrays pair up, with at most one trailing open zone.
+    dist_vals = dist_resampled
+    active = drs_resampled >= 10
+    starts = np.flatnonzero(active[1:] & ~active[:-1]) + 1
+    ends = np.flatnonzero(~active[1:] & active[:-1]) + 1
+    if ends.size and (not starts.size or ends[0] < starts[0]):
+        ends = ends[1:]
+    lap_drs_zones.extend(
+        {"zone_start": float(dist_vals[s]), "zone_end": float(dist_vals[e])}
+        for s, e in zip(starts, ends)
+    )
+    if starts.size > ends.size:
+        lap_drs_zones.append({"zone_start": float(dist_vals[starts[-1]]), "zone_end": None})
 
     # Set the time of the final frame to the exact lap time
             
@@ -1520,6 +1808,92 @@ def get_driver_quali_telemetry(session, driver_code: str, quali_segment: str):
     }
 
 
+_QUALI_FLOAT_FIELDS = ("x", "y", "dist", "speed", "throttle", "brake")
+_QUALI_INT_FIELDS = ("gear", "drs")
+_QUALI_WEATHER_FIELDS = ("track_temp", "air_temp", "humidity", "wind_speed", "wind_direction")
+
+
+def _pack_quali_frames(frames):
+    """Pack per-frame dicts into a dict of arrays (SoA) for compact pickling.
+
+    A few thousand frame dicts pickle as tens of thousands of small objects;
+    as arrays the same data serializes at near-memcpy speed and at a fraction
+    of the size. float32 is plenty for rendering precision.
+    """
+    packed = {
+        "t": np.array([f["t"] for f in frames], dtype=np.float64),
+        **{
+            name: np.array([f[name] for f in frames], dtype=np.float32)
+            for name in _QUALI_FLOAT_FIELDS + _QUALI_INT_FIELDS
+        },
+    }
+    if frames and "weather" in frames[0]:
+        packed["weather"] = {
+            name: np.array(
+                [np.nan if f["weather"][name] is None else f["weather"][name] for f in frames],
+                dtype=np.float32,
+            )
+            for name in _QUALI_WEATHER_FIELDS
+        }
+        packed["weather"]["raining"] = np.array(
+            [f["weather"]["rain_state"] == "RAINING" for f in frames], dtype=bool
+        )
+    return packed
+
+
+def _unpack_quali_frames(packed):
+    """Rebuild the list of per-frame dicts from a packed SoA payload."""
+    ts = packed["t"].tolist()
+    float_cols = {name: packed[name].astype(float).tolist() for name in _QUALI_FLOAT_FIELDS}
+    int_cols = {name: packed[name].astype(int).tolist() for name in _QUALI_INT_FIELDS}
+    frames = [
+        {
+            "t": ts[i],
+            "x": float_cols["x"][i],
+            "y": float_cols["y"][i],
+            "dist": float_cols["dist"][i],
+            "speed": float_cols["speed"][i],
+            "gear": int_cols["gear"][i],
+            "throttle": float_cols["throttle"][i],
+            "brake": float_cols["brake"][i],
+            "drs": int_cols["drs"][i],
+        }
+        for i in range(len(ts))
+    ]
+    if "weather" in packed:
+        weather_cols = {
+            name: [None if v != v else v for v in packed["weather"][name].astype(float).tolist()]
+            for name in _QUALI_WEATHER_FIELDS
+        }
+        raining = packed["weather"]["raining"].tolist()
+        for i, frame in enumerate(frames):
+            frame["weather"] = {
+                **{name: weather_cols[name][i] for name in _QUALI_WEATHER_FIELDS},
+                "rain_state": "RAINING" if raining[i] else "DRY",
+            }
+    return frames
+
+
+def _unpack_quali_cache(data):
+    """Expand a SoA-format quali cache payload back to the frames structure."""
+    segments = {}
+    for segment_name, segment in data["segments"].items():
+        segments[segment_name] = {
+            "duration": segment["duration"],
+            "drivers": {
+                code: {
+                    "frames": _unpack_quali_frames(driver["frames"]),
+                    "lap_time": driver["lap_time"],
+                }
+                for code, driver in segment["drivers"].items()
+            },
+        }
+    unpacked = dict(data)
+    del unpacked["format"]
+    unpacked["segments"] = segments
+    return unpacked
+
+
 def get_quali_telemetry(session, session_type='Q', refresh=False, progress_callback=None):
     event_name = str(session).replace(' ', '_')
     cache_suffix = 'sprintquali' if session_type == 'SQ' else 'quali'
@@ -1533,6 +1907,8 @@ def get_quali_telemetry(session, session_type='Q', refresh=False, progress_callb
         if not refresh and "--refresh-data" not in sys.argv:
             with open(cache_file, "rb") as f:
                 data = pickle.load(f)
+                if isinstance(data, dict) and data.get("format") == "quali-soa-v1":
+                    data = _unpack_quali_cache(data)
                 print(f"Loaded precomputed {cache_suffix} telemetry data.")
                 print("The replay should begin in a new window shortly!")
                 if progress_callback:
@@ -1598,8 +1974,27 @@ def get_quali_telemetry(session, session_type='Q', refresh=False, progress_callb
         "min_speed": min_speed,
     }
 
+    # Cache the frames in SoA (dict-of-arrays) form; the in-memory structure
+    # handed to callers keeps its list-of-dicts shape
+    packed_segments = {
+        segment_name: {
+            "duration": segment["duration"],
+            "drivers": {
+                code: {
+                    "frames": _pack_quali_frames(driver["frames"]),
+                    "lap_time": driver["lap_time"],
+                }
+                for code, driver in segment["drivers"].items()
+            },
+        }
+        for segment_name, segment in segments.items()
+    }
     with open(cache_file, "wb") as f:
-        pickle.dump(output_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.dump(
+            {**output_data, "segments": packed_segments, "format": "quali-soa-v1"},
+            f,
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
 
     return output_data
 
@@ -1617,27 +2012,45 @@ def get_lap_telemetry(session, driver_codes: list, lap_numbers: list):
     """
     result = []
 
+    # Comparison requests often repeat a driver (different laps); slice each
+    # driver's laps from the session once instead of rescanning per request
+    laps_by_driver = {}
+
     for driver_code, lap_num in zip(driver_codes, lap_numbers):
         try:
-            driver_laps = session.laps.pick_drivers(driver_code)
+            if driver_code not in laps_by_driver:
+                laps_by_driver[driver_code] = session.laps.pick_drivers(driver_code)
+            driver_laps = laps_by_driver[driver_code]
             lap = driver_laps[driver_laps['LapNumber'] == lap_num].iloc[0]
             telemetry = lap.get_telemetry()
 
             if telemetry.empty:
                 continue
 
-            points = []
-            for _, row in telemetry.iterrows():
-                points.append({
-                    "distance": float(row["Distance"]),
-                    "speed": float(row["Speed"]),
-                    "throttle": float(row["Throttle"]),
-                    "brake": float(row["Brake"]),
-                    "rpm": int(row["RPM"]) if pd.notna(row["RPM"]) else 0,
-                    "gear": int(row["nGear"]),
-                    "x": float(row["X"]),
-                    "y": float(row["Y"]),
-                })
+            # Extract the columns once and zip native lists instead of iterrows
+            rpm_arr = telemetry["RPM"].to_numpy(dtype=float)
+            points = [
+                {
+                    "distance": distance,
+                    "speed": speed,
+                    "throttle": throttle,
+                    "brake": brake,
+                    "rpm": rpm,
+                    "gear": gear,
+                    "x": x,
+                    "y": y,
+                }
+                for distance, speed, throttle, brake, rpm, gear, x, y in zip(
+                    telemetry["Distance"].to_numpy(dtype=float).tolist(),
+                    telemetry["Speed"].to_numpy(dtype=float).tolist(),
+                    telemetry["Throttle"].to_numpy(dtype=float).tolist(),
+                    telemetry["Brake"].to_numpy(dtype=float).tolist(),
+                    np.nan_to_num(rpm_arr, nan=0.0).astype(int).tolist(),
+                    telemetry["nGear"].to_numpy(dtype=float).astype(int).tolist(),
+                    telemetry["X"].to_numpy(dtype=float).tolist(),
+                    telemetry["Y"].to_numpy(dtype=float).tolist(),
+                )
+            ]
 
             lap_time = float(lap["LapTime"].total_seconds()) if pd.notna(lap["LapTime"]) else None
 
@@ -1667,15 +2080,36 @@ def get_sector_times(session, driver_codes: list, lap_numbers: list):
     """
     result = []
 
+    # Slice each driver's laps once and convert the four timedelta columns in
+    # one vectorized .dt.total_seconds() pass, instead of four scalar
+    # conversions with pd.notna guards per requested lap
+    seconds_by_driver = {}
+
     for driver_code, lap_num in zip(driver_codes, lap_numbers):
         try:
-            driver_laps = session.laps.pick_drivers(driver_code)
-            lap = driver_laps[driver_laps['LapNumber'] == lap_num].iloc[0]
-
-            sector_1 = float(lap["Sector1Time"].total_seconds()) if pd.notna(lap["Sector1Time"]) else None
-            sector_2 = float(lap["Sector2Time"].total_seconds()) if pd.notna(lap["Sector2Time"]) else None
-            sector_3 = float(lap["Sector3Time"].total_seconds()) if pd.notna(lap["Sector3Time"]) else None
-            lap_time = float(lap["LapTime"].total_seconds()) if pd.notna(lap["LapTime"]) else None
+            if driver_code not in seconds_by_driver:
+                driver_laps = session.laps.pick_drivers(driver_code)
+                seconds_by_driver[driver_code] = (
+                    driver_laps["LapNumber"].to_numpy(),
+                    {
+                        name: driver_laps[name].dt.total_seconds().to_numpy()
+                        for name in ("Sector1Time", "Sector2Time", "Sector3Time", "LapTime")
+                    },
+                )
+            lap_nums, seconds = seconds_by_driver[driver_code]
+            matches = np.flatnonzero(lap_nums == lap_num)
+            if matches.size == 0:
+                raise IndexError(f"lap {lap_num} not found")
+            row = int(matches[0])
+
+            s1 = seconds["Sector1Time"][row]
+            s2 = seconds["Sector2Time"][row]
+            s3 = seconds["Sector3Time"][row]
+            lt = seconds["LapTime"][row]
+            sector_1 = None if s1 != s1 else float(s1)
+            sector_2 = None if s2 != s2 else float(s2)
+            sector_3 = None if s3 != s3 else float(s3)
+            lap_time = None if lt != lt else float(lt)
 
             result.append({
                 "driver_code": driver_code,
@@ -1693,18 +2127,27 @@ def get_sector_times(session, driver_codes: list, lap_numbers: list):
 
 
 def list_rounds(year):
-    """Lists all rounds for a given year."""
+    """Lists all rounds for a given year.
+
+    Returns:
+        List of dicts with round number and event name
+    """
     enable_cache()
-    print(f"F1 Schedule {year}")
     schedule = fastf1.get_event_schedule(year)
-    for _, event in schedule.iterrows():
-        print(f"{event['RoundNumber']}: {event['EventName']}")
-    sys.exit()
+    return [
+        {"round": int(round_number), "name": event_name}
+        for round_number, event_name in schedule[["RoundNumber", "EventName"]].itertuples(
+            index=False, name=None
+        )
+    ]
 
 def list_sprints(year):
-    """Lists all sprint rounds for a given year."""
+    """Lists all sprint rounds for a given year.
+
+    Returns:
+        List of dicts with round number and event name
+    """
     enable_cache()
-    print(f"F1 Sprint Races {year}")
     schedule = fastf1.get_event_schedule(year)
     sprint_name = 'sprint_qualifying'
     if year == 2023:
@@ -1712,9 +2155,9 @@ def list_sprints(year):
     if year in [2021, 2022]:
         sprint_name = 'sprint'
     sprints = schedule[schedule['EventFormat'] == sprint_name]
-    if sprints.empty:
-        print(f"No sprint races found for {year}.")
-    else:
-        for _, event in sprints.iterrows():
-            print(f"{event['RoundNumber']}: {event['EventName']}")
-    sys.exit()
\ No newline at end of file
+    return [
+        {"round": int(round_number), "name": event_name}
+        for round_number, event_name in sprints[["RoundNumber", "EventName"]].itertuples(
+            index=False, name=None
+        )
+    ]
\ No newline at end of file
@@ -31,7 +31,13 @@ def compute_sector_boundaries(telemetry_df, lap_obj):
         times = telemetry_df["Time"].values
         distances = telemetry_df["Distance"].values
 
-        times_s = times.astype("timedelta64[ns]").astype(np.float64) / 1e9
+        if times.dtype == np.dtype("timedelta64[ns]"):
+            # Reinterpret the nanosecond ticks in place (zero-copy view) and
+            # scale once, instead of allocating two intermediate arrays
+            times_s = times.view(np.int64).astype(np.float64)
+            times_s /= 1e9
+        else:
+            times_s = times.astype("timedelta64[ns]").astype(np.float64) / 1e9
 
         s1_end_t = s1_time.total_seconds()
         s2_end_t = s1_end_t + s2_time.total_seconds()
@@ -39,16 +45,15 @@ def compute_sector_boundaries(telemetry_df, lap_obj):
         s1_end_dist = _interpolate_distance_at_time(times_s, distances, s1_end_t)
         s2_end_dist = _interpolate_distance_at_time(times_s, distances, s2_end_t)
 
-        sectors = np.zeros(len(distances), dtype=int)
-        for i, d in enumerate(distances):
-            if d <= s1_end_dist:
-                sectors[i] = 1
-            elif d <= s2_end_dist:
-                sectors[i] = 2
-            else:
-                sectors[i] = 3
+        # Bucket every point against the two sector-end distances in one C
+        # pass; side="left" keeps points exactly on a boundary in the earlier
+        # sector, matching the old d <= end comparisons
+        boundaries = np.array([s1_end_dist, s2_end_dist])
+        sectors = np.searchsorted(boundaries, distances, side="left") + 1
 
-        return sectors.tolist()
+        # Keep the ndarray; callers convert to native ints at their own
+        # serialization boundary
+        return sectors
     except Exception as e:
         print(f"Warning: Could not compute sector boundaries: {e}")
         return None
@@ -86,21 +91,25 @@ def build_track_from_example_lap(example_lap, track_width=300, lap_obj=None):
         dict with centerline, inner, outer coordinates (including Z elevation),
         bounding box, and sector data
     """
-    plot_x_ref = example_lap["X"].values
-    plot_y_ref = example_lap["Y"].values
+    # Display geometry doesn't need double precision; float32 halves the
+    # memory traffic through the gradient/normalize passes below
+    plot_x_ref = example_lap["X"].to_numpy(dtype=np.float32)
+    plot_y_ref = example_lap["Y"].to_numpy(dtype=np.float32)
 
     # Extract Z (elevation) if available
     if "Z" in example_lap.columns:
-        plot_z_ref = example_lap["Z"].values.astype(float)
+        plot_z_ref = example_lap["Z"].to_numpy(dtype=np.float32)
         # Replace NaN with 0
         plot_z_ref = np.nan_to_num(plot_z_ref, nan=0.0)
     else:
-        plot_z_ref = np.zeros(len(plot_x_ref))
+        plot_z_ref = np.zeros(len(plot_x_ref), dtype=np.float32)
 
     dx = np.gradient(plot_x_ref)
     dy = np.gradient(plot_y_ref)
 
-    norm = np.sqrt(dx**2 + dy**2)
+    # hypot does the magnitude in one pass; normalize in place to avoid
+    # extra float temporaries
+    norm = np.hypot(dx, dy)
     norm[norm == 0] = 1.0
     dx /= norm
     dy /= norm
@@ -108,10 +117,11 @@ def build_track_from_example_lap(example_lap, track_width=300, lap_obj=None):
     nx = -dy
     ny = dx
 
-    x_outer = plot_x_ref + nx * (track_width / 2)
-    y_outer = plot_y_ref + ny * (track_width / 2)
-    x_inner = plot_x_ref - nx * (track_width / 2)
-    y_inner = plot_y_ref - ny * (track_width / 2)
+    half_width = np.float32(track_width / 2)
+    x_outer = plot_x_ref + nx * half_width
+    y_outer = plot_y_ref + ny * half_width
+    x_inner = plot_x_ref - nx * half_width
+    y_inner = plot_y_ref - ny * half_width
 
     x_min = min(plot_x_ref.min(), x_inner.min(), x_outer.min())
     x_max = max(plot_x_ref.max(), x_inner.max(), x_outer.max())
@@ -26,12 +26,13 @@ try:
     print(f"Sector array: {track_data[10] is not None}")
 
     if track_data[10] is not None:
-        sectors = track_data[10]
-        unique_sectors = set(sectors)
-        print(f"Unique sectors: {sorted(unique_sectors)}")
-        print(f"Sector 1 count: {sum(1 for s in sectors if s == 1)}")
-        print(f"Sector 2 count: {sum(1 for s in sectors if s == 2)}")
-        print(f"Sector 3 count: {sum(1 for s in sectors if s == 3)}")
+        import numpy as np
+        sectors = np.asarray(track_data[10])
+        counts = np.bincount(sectors, minlength=4)
+        print(f"Unique sectors: {sorted(np.unique(sectors).tolist())}")
+        print(f"Sector 1 count: {counts[1]}")
+        print(f"Sector 2 count: {counts[2]}")
+        print(f"Sector 3 count: {counts[3]}")
         print(f"First 10 sectors: {list(sectors[:10])}")
         print("✅ Sector computation successful!")
     else: